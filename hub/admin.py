@@ -5,6 +5,33 @@ from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import User
 
 from .models import Contribution, Department, Event, Profile, Signup
+from .pagination import CachingPaginator
+
+
+def _is_changelist(request):
+    # True when the request targets a changelist page rather than a change form
+    match = request.resolver_match
+    return bool(match and match.url_name and match.url_name.endswith("_changelist"))
+
+
+class EventIdListFilter(admin.SimpleListFilter):
+    # Filter by ?event=<id> without listing every event in the sidebar
+    title = "event"
+    parameter_name = "event"
+
+    def lookups(self, request, model_admin):
+        # Only the selected event is offered, so the sidebar never loads all events
+        event_id = self.value()
+        if event_id and event_id.isdigit():
+            event = Event.objects.filter(pk=event_id).only("title", "date").first()
+            if event:
+                return [(event_id, str(event))]
+        return []
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(event_id=self.value())
+        return queryset
 
 
 # USER ADMIN WITH PROFILE INLINE
@@ -16,6 +43,12 @@ class ProfileInline(admin.StackedInline):
     verbose_name_plural = 'Profile'
     fields = ('is_coordinator', 'department', 'phone')
 
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # Build the department dropdown from a single ordered query
+        if db_field.name == "department":
+            kwargs["queryset"] = Department.objects.order_by("name")
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
 
 class UserAdmin(BaseUserAdmin):
     # Extended User admin with Profile inline
@@ -43,20 +76,54 @@ class ProfileAdmin(admin.ModelAdmin):
     list_filter = ("is_coordinator", "department")
     search_fields = ("user__username", "user__email", "user__first_name", "user__last_name")
     list_editable = ("is_coordinator",)
-    raw_id_fields = ("user",)
+    list_select_related = ("user", "department")
+    autocomplete_fields = ("user",)
     ordering = ("user__username",)
+    actions = ("make_coordinator", "remove_coordinator")
+
+    @admin.action(description="Make selected users coordinators")
+    def make_coordinator(self, request, queryset):
+        # Single UPDATE over the selection instead of one save() per profile
+        updated = queryset.update(is_coordinator=True)
+        self.message_user(request, f"{updated} profile(s) marked as coordinator.")
+
+    @admin.action(description="Remove coordinator status from selected users")
+    def remove_coordinator(self, request, queryset):
+        updated = queryset.update(is_coordinator=False)
+        self.message_user(request, f"{updated} profile(s) marked as volunteer.")
 
 
 # EVENT ADMIN
 
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
-    list_display = ("title", "department", "date", "location", "capacity", "status", "created_by")
+    list_display = (
+        "title", "department", "date", "location", "capacity", "signup_count", "status", "created_by"
+    )
     list_filter = ("status", "department", "date")
     search_fields = ("title", "description", "location")
-    date_hierarchy = "date"
+    list_select_related = ("department", "created_by")
+    sortable_by = ("date", "status")
+    list_per_page = 25
+    paginator = CachingPaginator
+    show_full_result_count = False
     ordering = ("-date",)
-    raw_id_fields = ("created_by",)
+    autocomplete_fields = ("created_by",)
+
+    def get_queryset(self, request):
+        # Fetch only the columns rendered on the changelist
+        queryset = super().get_queryset(request).select_related("department", "created_by")
+        if _is_changelist(request):
+            queryset = queryset.only(
+                "id", "title", "date", "location", "capacity", "status", "confirmed_count",
+                "department__name", "created_by__username",
+            )
+        return queryset
+
+    @admin.display(description="Signups")
+    def signup_count(self, obj):
+        # Read the denormalized counter instead of joining every signup
+        return obj.confirmed_count
 
 
 # SIGNUP ADMIN
@@ -64,11 +131,26 @@ class EventAdmin(admin.ModelAdmin):
 @admin.register(Signup)
 class SignupAdmin(admin.ModelAdmin):
     list_display = ("user", "event", "status", "created_at")
-    list_filter = ("status", "created_at", "event")
+    list_filter = ("status", "created_at", EventIdListFilter)
     search_fields = ("user__username", "event__title")
-    raw_id_fields = ("user", "event")
+    list_select_related = ("user", "event")
+    sortable_by = ("created_at", "status")
+    list_per_page = 25
+    paginator = CachingPaginator
+    show_full_result_count = False
+    autocomplete_fields = ("user", "event")
     ordering = ("-created_at",)
 
+    def get_queryset(self, request):
+        # Fetch only the columns rendered on the changelist
+        queryset = super().get_queryset(request).select_related("user", "event")
+        if _is_changelist(request):
+            queryset = queryset.only(
+                "id", "status", "created_at",
+                "user__username", "event__title", "event__date",
+            )
+        return queryset
+
 
 # CONTRIBUTION ADMIN
 
@@ -77,7 +159,24 @@ class ContributionAdmin(admin.ModelAdmin):
     list_display = ("user", "event", "department", "hours", "status", "date", "approved_by")
     list_filter = ("status", "department", "date")
     search_fields = ("user__username", "description", "rejection_reason")
-    date_hierarchy = "date"
+    list_select_related = ("user", "event", "department", "approved_by")
+    sortable_by = ("date", "created_at", "status")
+    list_per_page = 25
+    paginator = CachingPaginator
+    show_full_result_count = False
     ordering = ("-created_at",)
-    raw_id_fields = ("user", "approved_by", "event")
+    autocomplete_fields = ("user", "approved_by", "event")
     readonly_fields = ("created_at", "approved_at")
+
+    def get_queryset(self, request):
+        # Fetch only the columns rendered on the changelist
+        queryset = super().get_queryset(request).select_related(
+            "user", "event", "department", "approved_by"
+        )
+        if _is_changelist(request):
+            queryset = queryset.only(
+                "id", "hours", "status", "date", "created_at",
+                "user__username", "event__title", "event__date",
+                "department__name", "approved_by__username",
+            )
+        return queryset
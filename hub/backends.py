@@ -0,0 +1,17 @@
+"""Authentication backends for VolunTrack."""
+
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import User
+
+
+class ProfileModelBackend(ModelBackend):
+    # ModelBackend that loads the session user together with their profile and
+    # department, so request.user.profile never needs a query of its own
+    def get_user(self, user_id):
+        user = (
+            User._default_manager
+            .select_related("profile", "profile__department")
+            .filter(pk=user_id)
+            .first()
+        )
+        return user if user and self.user_can_authenticate(user) else None
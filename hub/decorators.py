@@ -8,7 +8,10 @@ def coordinator_required(view_func):
     # Restrict view access to coordinator users only
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
-        if hasattr(request.user, "profile") and request.user.profile.is_coordinator:
+        is_coordinator = getattr(request, "is_coordinator", None)
+        if is_coordinator is None:
+            is_coordinator = hasattr(request.user, "profile") and request.user.profile.is_coordinator
+        if is_coordinator:
             return view_func(request, *args, **kwargs)
         raise PermissionDenied
     
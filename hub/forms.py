@@ -6,31 +6,42 @@ from django.contrib.auth.models import User
 from .models import Contribution, Department, Event
 
 
+# Bootstrap widget attrs (widgets copy these, so sharing them is safe)
+FORM_CONTROL_ATTRS = {'class': 'form-control'}
+FORM_SELECT_ATTRS = {'class': 'form-select'}
+
+
 class UserRegistrationForm(UserCreationForm):
     # Form for new user registration
     email = forms.EmailField(
         required=True,
-        help_text="Required. Enter a valid email address."
+        help_text="Required. Enter a valid email address.",
+        widget=forms.EmailInput(attrs=FORM_CONTROL_ATTRS)
     )
     first_name = forms.CharField(
         max_length=30, 
         required=False,
-        help_text="Optional."
+        help_text="Optional.",
+        widget=forms.TextInput(attrs=FORM_CONTROL_ATTRS)
     )
     last_name = forms.CharField(
         max_length=30, 
         required=False,
-        help_text="Optional."
+        help_text="Optional.",
+        widget=forms.TextInput(attrs=FORM_CONTROL_ATTRS)
     )
 
     class Meta:
         model = User
         fields = ("username", "email", "first_name", "last_name", "password1", "password2")
+        widgets = {"username": forms.TextInput(attrs=FORM_CONTROL_ATTRS)}
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            field.widget.attrs.setdefault('class', 'form-control')
+        # Password fields are declared on UserCreationForm and shared with
+        # Django's own forms, so they are styled per instance
+        for name in ("password1", "password2"):
+            self.fields[name].widget.attrs.setdefault('class', 'form-control')
 
 
 class ContributionForm(forms.ModelForm):
@@ -39,14 +50,35 @@ class ContributionForm(forms.ModelForm):
     class Meta:
         model = Contribution
         fields = ["event", "department", "date", "hours", "description"]
+        widgets = {
+            "event": forms.Select(attrs=FORM_SELECT_ATTRS),
+            "department": forms.Select(attrs=FORM_SELECT_ATTRS),
+            "date": forms.DateInput(attrs={**FORM_CONTROL_ATTRS, 'type': 'date'}),
+            "hours": forms.NumberInput(attrs={
+                **FORM_CONTROL_ATTRS,
+                'step': '0.5',
+                'min': '0',
+                'placeholder': 'e.g., 2.5'
+            }),
+            "description": forms.Textarea(attrs={
+                **FORM_CONTROL_ATTRS,
+                'rows': '4',
+                'placeholder': 'Describe the work you did...'
+            }),
+        }
 
     def __init__(self, *args, user=None, initial_event=None, **kwargs):
         super().__init__(*args, **kwargs)
+        profile = getattr(user, "profile", None)
 
-        # Event field
-        event_queryset = Event.objects.filter(status="SCHEDULED")
+        # Event field (only the columns the dropdown and view checks need)
+        event_queryset = (
+            Event.objects
+            .filter(status="SCHEDULED")
+            .only("id", "title", "date", "status")
+        )
         
-        if user and not user.profile.is_coordinator:
+        if user and not (profile and profile.is_coordinator):
             event_queryset = event_queryset.filter(
                 signups__user=user, 
                 signups__status="CONFIRMED"
@@ -59,10 +91,9 @@ class ContributionForm(forms.ModelForm):
             self.fields["event"].initial = initial_event
 
         # Department field
-        dept_queryset = Department.objects.order_by("name")
-        self.fields["department"].queryset = dept_queryset
+        self.fields["department"].queryset = Department.objects.order_by("name")
         
-        if dept_queryset.exists():
+        if Department.any_exist():
             self.fields["department"].empty_label = "Select a department..."
         else:
             self.fields["department"].empty_label = "No departments available"
@@ -70,30 +101,8 @@ class ContributionForm(forms.ModelForm):
                 "No departments exist. Please contact an administrator."
             )
 
-        if user and hasattr(user, 'profile') and user.profile.department:
-            self.fields["department"].initial = user.profile.department
-
-        # Widget styling
-        for name, field in self.fields.items():
-            if name in ('event', 'department'):
-                field.widget.attrs['class'] = 'form-select'
-            else:
-                field.widget.attrs['class'] = 'form-control'
-
-        self.fields["date"].widget = forms.DateInput(
-            attrs={'class': 'form-control', 'type': 'date'}
-        )
-
-        self.fields["hours"].widget.attrs.update({
-            'step': '0.5',
-            'min': '0',
-            'placeholder': 'e.g., 2.5'
-        })
-
-        self.fields["description"].widget.attrs.update({
-            'rows': '4',
-            'placeholder': 'Describe the work you did...'
-        })
+        if profile and profile.department_id:
+            self.fields["department"].initial = profile.department_id
 
 
 class EventForm(forms.ModelForm):
@@ -102,37 +111,36 @@ class EventForm(forms.ModelForm):
     class Meta:
         model = Event
         fields = ["title", "description", "department", "date", "location", "capacity"]
+        widgets = {
+            "title": forms.TextInput(attrs=FORM_CONTROL_ATTRS),
+            "description": forms.Textarea(attrs={
+                **FORM_CONTROL_ATTRS,
+                'rows': '4',
+                'placeholder': 'Describe the event, what volunteers will do, what to bring...'
+            }),
+            "department": forms.Select(attrs=FORM_SELECT_ATTRS),
+            "date": forms.DateTimeInput(attrs={**FORM_CONTROL_ATTRS, 'type': 'datetime-local'}),
+            "location": forms.TextInput(attrs=FORM_CONTROL_ATTRS),
+            "capacity": forms.NumberInput(attrs={
+                **FORM_CONTROL_ATTRS,
+                'min': '0',
+                'placeholder': '0 for unlimited'
+            }),
+        }
+        help_texts = {
+            "title": "A clear, descriptive name for the event",
+            "location": "Where the event will take place",
+            "capacity": "Maximum signups allowed (0 = unlimited)",
+        }
 
     def __init__(self, *args, user=None, **kwargs):
         super().__init__(*args, **kwargs)
-
-        # Widget styling
-        for field in self.fields.values():
-            field.widget.attrs.setdefault('class', 'form-control')
-
-        self.fields["date"].widget = forms.DateTimeInput(
-            attrs={'class': 'form-control', 'type': 'datetime-local'}
-        )
-
-        self.fields["capacity"].widget.attrs.update({
-            'min': '0',
-            'placeholder': '0 for unlimited'
-        })
-        self.fields["capacity"].help_text = "Maximum signups allowed (0 = unlimited)"
+        profile = getattr(user, "profile", None)
 
         # Department field
-        self.fields["department"].widget.attrs['class'] = 'form-select'
         self.fields["department"].queryset = Department.objects.order_by("name")
         self.fields["department"].empty_label = "No department (optional)"
         self.fields["department"].required = False
 
-        if user and user.profile.is_coordinator and user.profile.department:
-            self.fields["department"].initial = user.profile.department
-
-        # Help text
-        self.fields["title"].help_text = "A clear, descriptive name for the event"
-        self.fields["location"].help_text = "Where the event will take place"
-        self.fields["description"].widget.attrs.update({
-            'rows': '4',
-            'placeholder': 'Describe the event, what volunteers will do, what to bring...'
-        })
+        if profile and profile.is_coordinator and profile.department_id:
+            self.fields["department"].initial = profile.department_id
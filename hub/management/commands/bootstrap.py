@@ -13,13 +13,15 @@ What It Creates:
     2. A coordinator user (username: coordinator, password: coordinator123)
 
 Note:
-    - Departments are created with get_or_create (idempotent)
+    - Missing departments are created in one bulk insert (idempotent)
     - Coordinator user is only created if it doesn't exist
     - Safe to run multiple times
 """
 
 from django.contrib.auth.models import User
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q
 
 from hub.models import Department
 
@@ -28,29 +30,46 @@ class Command(BaseCommand):
     """
     Django management command to bootstrap sample data.
     
-    This command is safe to run multiple times - it uses
-    get_or_create for departments and checks existence for users.
+    This command is safe to run multiple times - it only inserts
+    missing departments and checks existence for users.
     """
     
     help = "Create sample departments and an initial coordinator user"
 
+    @transaction.atomic
     def handle(self, *args, **options):
         """
         Execute the bootstrap command.
         
         Creates sample departments and a coordinator user if they don't exist.
+        All writes run in a single transaction.
         
         Args:
             *args: Positional arguments (unused)
-            **options: Command options (unused)
+            **options: Command options (verbosity controls per-row output)
         """
+        verbosity = options.get("verbosity", 1)
+
         # ----- CREATE DEPARTMENTS -----
         department_names = ["Logistics", "Outreach", "Fundraising", "Cleanup"]
         
-        for name in department_names:
-            department, created = Department.objects.get_or_create(name=name)
-            if created:
-                self.stdout.write(f"  Created department: {name}")
+        existing_names = set(
+            Department.objects
+            .filter(name__in=department_names)
+            .values_list("name", flat=True)
+        )
+        new_names = [name for name in department_names if name not in existing_names]
+
+        # Single INSERT for all missing departments (bulk_create skips signals)
+        Department.objects.bulk_create(
+            [Department(name=name) for name in new_names],
+            ignore_conflicts=True,
+        )
+        Department.clear_cache()
+
+        if new_names and verbosity >= 1:
+            # One buffered write instead of a flushed write per department
+            self.stdout.write("\n".join(f"  Created department: {name}" for name in new_names))
         
         self.stdout.write(
             self.style.SUCCESS(f"✓ {len(department_names)} departments ensured")
@@ -72,20 +91,28 @@ class Command(BaseCommand):
                 last_name="Lead"
             )
             
-            # Profile is created automatically via signal
-            # Update it to make this user a coordinator
-            user.refresh_from_db()  # Ensure profile is attached
-            user.profile.is_coordinator = True
-            user.profile.department = Department.objects.first()
-            user.profile.save()
+            # Profile is created automatically via signal and is already
+            # cached on the user, so update it without re-fetching
+            profile = user.profile
+            profile.is_coordinator = True
+            profile.department_id = (
+                Department.objects.order_by("name").values_list("pk", flat=True).first()
+            )
+            profile.save(update_fields=["is_coordinator", "department"])
             
             self.stdout.write(
                 self.style.SUCCESS(f"✓ Coordinator user created: {coordinator_username} / coordinator123")
             )
 
-        # Final summary
-        self.stdout.write("")
-        self.stdout.write(self.style.SUCCESS("Bootstrap complete!"))
-        self.stdout.write(f"  Departments: {Department.objects.count()}")
-        self.stdout.write(f"  Users: {User.objects.count()}")
-        self.stdout.write(f"  Coordinators: {User.objects.filter(profile__is_coordinator=True).count()}")
+        # Final summary (user totals in one aggregate query)
+        user_stats = User.objects.aggregate(
+            total=Count("id"),
+            coordinators=Count("id", filter=Q(profile__is_coordinator=True)),
+        )
+        self.stdout.write("\n".join([
+            "",
+            self.style.SUCCESS("Bootstrap complete!"),
+            f"  Departments: {Department.objects.count()}",
+            f"  Users: {user_stats['total']}",
+            f"  Coordinators: {user_stats['coordinators']}",
+        ]))
@@ -0,0 +1,47 @@
+"""
+hub/management/commands/create_missing_profiles.py - Profile Backfill Command
+
+Creates a Profile for every User that lacks one. Users loaded from fixtures
+or bulk imports skip the post_save signal, so they start without a profile.
+
+Usage:
+    python manage.py create_missing_profiles
+
+Note:
+    - Profiles are inserted in batches, conflicts are ignored
+    - Safe to run multiple times
+"""
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from hub.models import Profile
+
+
+class Command(BaseCommand):
+    """
+    Django management command to backfill missing profiles.
+    """
+
+    help = "Create default profiles for users that do not have one"
+
+    def handle(self, *args, **options):
+        """
+        Execute the backfill.
+
+        Streams users without a profile and bulk-inserts default profiles.
+
+        Args:
+            *args: Positional arguments (unused)
+            **options: Command options (unused)
+        """
+        missing = User.objects.filter(profile__isnull=True).only("pk")
+        created = Profile.objects.bulk_create(
+            (Profile(user=user) for user in missing.iterator(chunk_size=1000)),
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ {len(created)} missing profile(s) created")
+        )
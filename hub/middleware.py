@@ -0,0 +1,18 @@
+"""Custom middleware for VolunTrack."""
+
+
+class ProfileMiddleware:
+    # Expose the coordinator flag as request.is_coordinator. The profile is
+    # already loaded with the user by ProfileModelBackend, so this is free
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.is_coordinator = False
+
+        user = request.user
+        if user.is_authenticated:
+            profile = getattr(user, "profile", None)
+            request.is_coordinator = bool(profile and profile.is_coordinator)
+
+        return self.get_response(request)
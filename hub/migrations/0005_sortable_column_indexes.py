@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-15 01:33
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0004_contribution_rejection_reason'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='department',
+            options={'ordering': ['name']},
+        ),
+        migrations.AlterModelOptions(
+            name='profile',
+            options={'ordering': ['user__username']},
+        ),
+        migrations.AlterModelOptions(
+            name='signup',
+            options={'ordering': ['-created_at']},
+        ),
+        migrations.AlterField(
+            model_name='contribution',
+            name='approved_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='contributions_approved', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='contribution',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='contribution',
+            name='date',
+            field=models.DateField(db_index=True, default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name='contribution',
+            name='rejection_reason',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AlterField(
+            model_name='event',
+            name='date',
+            field=models.DateTimeField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='signup',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 01:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0005_sortable_column_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('status', 'SCHEDULED')), fields=['status', 'date'], name='event_sched_date_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-15 01:41
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_confirmed_count(apps, schema_editor):
+    # Populate the new counter from existing confirmed signups in one UPDATE
+    Event = apps.get_model('hub', 'Event')
+    Signup = apps.get_model('hub', 'Signup')
+    confirmed = (
+        Signup.objects
+        .filter(event=OuterRef('pk'), status='CONFIRMED')
+        .values('event')
+        .annotate(c=Count('*'))
+        .values('c')
+    )
+    Event.objects.update(confirmed_count=Coalesce(Subquery(confirmed), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0006_event_sched_date_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='confirmed_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_confirmed_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-15 01:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0007_event_confirmed_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['status', '-created_at'], name='contrib_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['user', '-date'], name='contrib_user_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['department', 'status'], name='contrib_dept_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(fields=['user', 'status'], name='signup_user_status_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-15 01:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0008_composite_filter_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='signup',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='signup',
+            constraint=models.UniqueConstraint(fields=('event', 'user'), name='uniq_event_user'),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(condition=models.Q(('status', 'CONFIRMED')), fields=['event'], name='signup_event_confirmed_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 02:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0009_signup_unique_constraint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['event', 'status'], name='contrib_event_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['created_by', 'date'], name='event_creator_date_idx'),
+        ),
+    ]
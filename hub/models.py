@@ -1,5 +1,8 @@
 """Database models for VolunTrack."""
 
+from uuid import uuid4
+
+from django.core.cache import cache
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
@@ -7,11 +10,30 @@ from django.utils import timezone
 
 class Department(models.Model):
     # Organizational unit for categorizing events and volunteers
+    EXISTS_CACHE_KEY = "hub:departments_exist"
+    LIST_CACHE_KEY = "hub:departments_list"
+
     name = models.CharField(max_length=100, unique=True)
 
     def __str__(self):
         return self.name
 
+    @classmethod
+    def any_exist(cls):
+        # Cached check for whether any department exists (cleared by signals)
+        return cache.get_or_set(cls.EXISTS_CACHE_KEY, cls.objects.exists, 300)
+
+    @classmethod
+    def cached_list(cls):
+        # Cached (id, name) rows for filter dropdowns (cleared by signals)
+        return cache.get_or_set(
+            cls.LIST_CACHE_KEY, lambda: list(cls.objects.only("id", "name")), 3600
+        )
+
+    @classmethod
+    def clear_cache(cls):
+        cache.delete_many([cls.EXISTS_CACHE_KEY, cls.LIST_CACHE_KEY])
+
     class Meta:
         ordering = ['name']
 
@@ -52,7 +74,7 @@ class Event(models.Model):
         blank=True, 
         on_delete=models.SET_NULL
     )
-    date = models.DateTimeField()
+    date = models.DateTimeField(db_index=True)
     location = models.CharField(max_length=200)
     capacity = models.PositiveIntegerField(default=0)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="SCHEDULED")
@@ -62,13 +84,26 @@ class Event(models.Model):
         related_name="events_created"
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    # Denormalized number of confirmed signups, maintained by signals
+    confirmed_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return f"{self.title} ({self.date:%Y-%m-%d})"
 
+    def save(self, *args, **kwargs):
+        # confirmed_count is maintained by F() updates in signals, so ordinary
+        # saves of an existing event leave it out rather than write back a stale value
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            skip = {"confirmed_count", *self.get_deferred_fields()}
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in skip
+            ]
+        super().save(*args, **kwargs)
+
     def get_confirmed_count(self):
         # Returns the number of confirmed signups
-        return self.signups.filter(status="CONFIRMED").count()
+        return self.confirmed_count
 
     def get_remaining_capacity(self):
         # Returns remaining spots, or None if unlimited
@@ -84,6 +119,22 @@ class Event(models.Model):
 
     class Meta:
         ordering = ["date"]
+        indexes = [
+            # Serves the scheduled-events dropdown and listings ordered by date
+            models.Index(
+                fields=["status", "date"],
+                name="event_sched_date_idx",
+                condition=models.Q(status="SCHEDULED"),
+            ),
+            # A coordinator's own events by date (dashboard "my events")
+            models.Index(fields=["created_by", "date"], name="event_creator_date_idx"),
+        ]
+
+
+class SignupQuerySet(models.QuerySet):
+    def with_related(self):
+        # Signups are almost always shown with their user and event
+        return self.select_related("user", "event", "event__department")
 
 
 class Signup(models.Model):
@@ -96,14 +147,28 @@ class Signup(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="signups")
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="CONFIRMED")
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    objects = SignupQuerySet.as_manager()
 
     def __str__(self):
         return f"{self.user.username} → {self.event.title} ({self.status})"
 
     class Meta:
-        unique_together = ("user", "event")
         ordering = ["-created_at"]
+        constraints = [
+            # Event-first so the unique index also serves per-event lookups
+            models.UniqueConstraint(fields=["event", "user"], name="uniq_event_user"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "status"], name="signup_user_status_idx"),
+            # Confirmed roster of an event (event detail participant list)
+            models.Index(
+                fields=["event"],
+                name="signup_event_confirmed_idx",
+                condition=models.Q(status="CONFIRMED"),
+            ),
+        ]
 
 
 class Contribution(models.Model):
@@ -113,11 +178,12 @@ class Contribution(models.Model):
         ("APPROVED", "Approved"),
         ("REJECTED", "Rejected"),
     ]
+    REPORTS_VERSION_KEY = "hub:reports_version"
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     event = models.ForeignKey(Event, null=True, blank=True, on_delete=models.SET_NULL)
     department = models.ForeignKey(Department, on_delete=models.CASCADE)
-    date = models.DateField(default=timezone.now)
+    date = models.DateField(default=timezone.now, db_index=True)
     hours = models.DecimalField(max_digits=5, decimal_places=2)
     description = models.TextField(blank=True)
     status = models.CharField(max_length=8, choices=STATUS_CHOICES, default="PENDING")
@@ -130,17 +196,27 @@ class Contribution(models.Model):
     )
     approved_at = models.DateTimeField(null=True, blank=True)
     rejection_reason = models.TextField(blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     def __str__(self):
         return f"{self.user.username}: {self.hours}h ({self.status})"
 
+    @classmethod
+    def reports_version(cls):
+        # Version stamp for cached reports (bumped by signals and bulk updates)
+        return cache.get_or_set(cls.REPORTS_VERSION_KEY, 0, None)
+
+    @classmethod
+    def invalidate_reports(cls):
+        # New token per write, so concurrent invalidations can't cancel out
+        cache.set(cls.REPORTS_VERSION_KEY, uuid4().hex, None)
+
     def approve(self, coordinator):
         # Approve this contribution
         self.status = "APPROVED"
         self.approved_by = coordinator
         self.approved_at = timezone.now()
-        self.save()
+        self.save(update_fields=["status", "approved_by", "approved_at"])
 
     def reject(self, coordinator, reason=""):
         # Reject this contribution with an optional reason
@@ -148,7 +224,17 @@ class Contribution(models.Model):
         self.approved_by = coordinator
         self.approved_at = timezone.now()
         self.rejection_reason = reason
-        self.save()
+        self.save(update_fields=["status", "approved_by", "approved_at", "rejection_reason"])
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Status-filtered lists in default order (approvals, logs, dashboards)
+            models.Index(fields=["status", "-created_at"], name="contrib_status_created_idx"),
+            # Per-user history by date
+            models.Index(fields=["user", "-date"], name="contrib_user_date_idx"),
+            # Department-scoped approval queues
+            models.Index(fields=["department", "status"], name="contrib_dept_status_idx"),
+            # Approved hours per event (event detail chart)
+            models.Index(fields=["event", "status"], name="contrib_event_status_idx"),
+        ]
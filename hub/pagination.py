@@ -0,0 +1,65 @@
+"""Pagination helpers for VolunTrack."""
+
+from hashlib import md5
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+
+def _count_version_key(model):
+    return f"hub:count_version:{model._meta.label_lower}"
+
+
+def count_version(model):
+    # Current write version of a model (changes whenever its rows do)
+    return cache.get_or_set(_count_version_key(model), 0, None)
+
+
+def bump_count_version(model):
+    # Invalidate every cached page count over this model (called by signals
+    # and after QuerySet.update() calls that change filtered columns). A fresh
+    # token rather than cache.incr(): incr is a get-then-set on the file cache,
+    # so concurrent bumps could collapse into one and leave a stale count live
+    cache.set(_count_version_key(model), uuid4().hex, None)
+
+
+class CachingPaginator(Paginator):
+    # Paginator that caches COUNT(*) for a minute, keyed on the query SQL and
+    # the model's count version so writes retire it on every worker
+    count_timeout = 60
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, "query", None)
+        if query is None:
+            return super().count
+
+        try:
+            sql = str(query)
+        except EmptyResultSet:
+            # .none() and empty pk__in filters compile to no SQL at all
+            return 0
+
+        key = f"hub:count:{count_version(query.model)}:" + md5(sql.encode()).hexdigest()
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, self.count_timeout)
+        return count
+
+
+class PkSubqueryPaginator(CachingPaginator):
+    # Paginator that slices a narrow pk-only subquery (keeping the list's
+    # ordering) and loads full rows, with their joins, only for that page
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        page_pks = self.object_list.values("pk")[bottom:top]
+        return self._get_page(self.object_list.filter(pk__in=page_pks), number, self)
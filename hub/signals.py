@@ -1,17 +1,89 @@
-"""Signal handlers for automatic Profile creation."""
+"""Signal handlers for automatic Profile creation and cache invalidation."""
 
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from .models import Profile
+from .models import Contribution, Department, Event, Profile, Signup
+from .pagination import bump_count_version
 
 
 @receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
+def create_user_profile(sender, instance, created, raw=False, **kwargs):
     # Automatically create a Profile when a new User is created
-    if created:
-        Profile.objects.create(user=instance)
+    # (skipped for fixture loads; see the create_missing_profiles command)
+    if created and not raw:
+        Profile.objects.get_or_create(user=instance)
 
 
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def clear_department_cache(sender, **kwargs):
+    # Drop cached department lookups whenever a department changes
+    Department.clear_cache()
 
+
+@receiver(post_save, sender=Contribution)
+@receiver(post_delete, sender=Contribution)
+def invalidate_reports_cache(sender, **kwargs):
+    # Any contribution change can move report totals
+    Contribution.invalidate_reports()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=Signup)
+@receiver(post_delete, sender=Signup)
+@receiver(post_save, sender=Contribution)
+@receiver(post_delete, sender=Contribution)
+def invalidate_page_counts(sender, **kwargs):
+    # Cached paginator counts over this model may now be wrong
+    bump_count_version(sender)
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_user_page_counts(sender, **kwargs):
+    # User lists are filtered on profile columns (coordinator management)
+    bump_count_version(User)
+
+
+def _adjust_confirmed_count(event_id, delta):
+    # Atomic in-database increment so concurrent signups don't race
+    if delta:
+        Event.objects.filter(pk=event_id).update(confirmed_count=F("confirmed_count") + delta)
+
+
+@receiver(pre_save, sender=Signup)
+def remember_signup_state(sender, instance, **kwargs):
+    # Record the stored (event_id, status) so post_save can tell which event
+    # gained or lost a confirmed signup, including moves between events
+    instance._previous_state = None
+    if instance.pk:
+        instance._previous_state = (
+            Signup.objects.filter(pk=instance.pk).values_list("event_id", "status").first()
+        )
+
+
+@receiver(post_save, sender=Signup)
+def update_confirmed_count_on_save(sender, instance, raw=False, **kwargs):
+    # Keep Event.confirmed_count in step with signup status and event changes
+    if raw:
+        return
+    deltas = {}
+    previous = getattr(instance, "_previous_state", None)
+    if previous and previous[1] == "CONFIRMED":
+        deltas[previous[0]] = -1
+    if instance.status == "CONFIRMED":
+        deltas[instance.event_id] = deltas.get(instance.event_id, 0) + 1
+    for event_id, delta in deltas.items():
+        _adjust_confirmed_count(event_id, delta)
+
+
+@receiver(post_delete, sender=Signup)
+def update_confirmed_count_on_delete(sender, instance, **kwargs):
+    if instance.status == "CONFIRMED":
+        _adjust_confirmed_count(instance.event_id, -1)
@@ -0,0 +1,23 @@
+"""Tests for the Hub application."""
+
+from django.contrib.auth import get_user
+from django.test import TestCase
+from django.urls import reverse
+
+
+class RegisterViewTests(TestCase):
+    def test_register_logs_in_and_redirects_to_dashboard(self):
+        # Registration must pick a backend for login() when several are configured
+        response = self.client.post(reverse("hub:register"), {
+            "username": "newvolunteer",
+            "email": "new@example.com",
+            "first_name": "New",
+            "last_name": "Volunteer",
+            "password1": "a-Strong-passw0rd",
+            "password2": "a-Strong-passw0rd",
+        })
+
+        self.assertRedirects(response, reverse("hub:dashboard"), fetch_redirect_response=False)
+        user = get_user(self.client)
+        self.assertTrue(user.is_authenticated)
+        self.assertEqual(user.username, "newvolunteer")
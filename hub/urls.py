@@ -1,8 +1,37 @@
 """URL Configuration for the Hub App."""
 
-from django.urls import path
+from django.urls import include, path
 from . import views
 
+# Grouped by prefix so the resolver skips a whole group on a prefix mismatch
+event_patterns = [
+    path("", views.events_list, name="events_list"),
+    path("<int:pk>/", views.event_detail, name="event_detail"),
+    path("create/", views.event_create, name="event_create"),
+    path("<int:pk>/edit/", views.event_edit, name="event_edit"),
+    path("<int:pk>/delete/", views.event_delete, name="event_delete"),
+    path("<int:pk>/status/", views.event_update_status, name="event_update_status"),
+    path("<int:pk>/signup/", views.event_signup, name="event_signup"),
+]
+
+signup_patterns = [
+    path("", views.signup_list, name="signup_list"),
+    path("<int:pk>/cancel/", views.signup_cancel, name="signup_cancel"),
+]
+
+approval_patterns = [
+    path("", views.approvals_list, name="approvals_list"),
+    path("<int:pk>/", views.approval_detail, name="approval_detail"),
+    path("<int:pk>/approve/", views.approval_approve, name="approval_approve"),
+    path("<int:pk>/reject/", views.approval_reject, name="approval_reject"),
+]
+
+log_patterns = [
+    path("", views.all_logs, name="all_logs"),
+    path("export/", views.export_logs_csv, name="export_logs_csv"),
+    path("<int:pk>/status/", views.log_update_status, name="log_update_status"),
+]
+
 urlpatterns = [
     # Public
     path("", views.home, name="home"),
@@ -12,31 +41,19 @@ urlpatterns = [
     path("dashboard/", views.dashboard, name="dashboard"),
 
     # Events
-    path("events/", views.events_list, name="events_list"),
-    path("events/<int:pk>/", views.event_detail, name="event_detail"),
-    path("events/create/", views.event_create, name="event_create"),
-    path("events/<int:pk>/edit/", views.event_edit, name="event_edit"),
-    path("events/<int:pk>/delete/", views.event_delete, name="event_delete"),
-    path("events/<int:pk>/status/", views.event_update_status, name="event_update_status"),
-    path("events/<int:pk>/signup/", views.event_signup, name="event_signup"),
+    path("events/", include(event_patterns)),
 
     # Signups
-    path("signups/", views.signup_list, name="signup_list"),
-    path("signups/<int:pk>/cancel/", views.signup_cancel, name="signup_cancel"),
+    path("signups/", include(signup_patterns)),
 
     # Contributions
     path("contributions/new/", views.contribution_create, name="contribution_create"),
 
     # Approvals
-    path("approvals/", views.approvals_list, name="approvals_list"),
-    path("approvals/<int:pk>/", views.approval_detail, name="approval_detail"),
-    path("approvals/<int:pk>/approve/", views.approval_approve, name="approval_approve"),
-    path("approvals/<int:pk>/reject/", views.approval_reject, name="approval_reject"),
+    path("approvals/", include(approval_patterns)),
 
     # Logs & Reports
-    path("logs/", views.all_logs, name="all_logs"),
-    path("logs/export/", views.export_logs_csv, name="export_logs_csv"),
-    path("logs/<int:pk>/status/", views.log_update_status, name="log_update_status"),
+    path("logs/", include(log_patterns)),
     path("reports/", views.reports, name="reports"),
 
     # Coordinator Management
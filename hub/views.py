@@ -1,27 +1,118 @@
 """View functions for VolunTrack."""
 
 import csv
-import json
+from hashlib import md5
 
 from django.contrib import messages
 from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
-from django.core.paginator import Paginator
-from django.db.models import Q, Sum
-from django.http import HttpResponse
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, F, FloatField, IntegerField, Prefetch, Q, Sum, Value, When
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
 from django.utils import timezone
+from django.utils.cache import patch_response_headers, patch_vary_headers
 
 from .decorators import coordinator_required
 from .forms import ContributionForm, EventForm, UserRegistrationForm
-from .models import Contribution, Department, Event, Signup
+from .models import Contribution, Department, Event, Profile, Signup
+from .pagination import PkSubqueryPaginator, bump_count_version, count_version
+
+
+# Valid status codes for the status-update POST handlers
+EVENT_STATUSES = frozenset(code for code, _ in Event.STATUS_CHOICES)
+CONTRIBUTION_STATUSES = frozenset(code for code, _ in Contribution.STATUS_CHOICES)
+
+# Columns rendered by the approvals and logs tables
+CONTRIBUTION_LIST_FIELDS = (
+    "id", "status", "hours", "date", "created_at", "approved_at",
+    "user__username", "user__first_name", "user__last_name",
+    "department__name", "event__title",
+    "approved_by__username", "approved_by__first_name", "approved_by__last_name",
+)
+
+
+class _Echo:
+    # File-like object for csv.writer that hands each row back instead of buffering it
+    def write(self, value):
+        return value
+
+
+def _seek_page(request, queryset, page_size):
+    # Keyset pagination on (-created_at, -pk). ?after=<pk> / ?before=<pk> seek past
+    # the boundary row instead of using OFFSET, so deep pages cost the same as the first
+    after = request.GET.get("after", "")
+    before = request.GET.get("before", "")
+    pivot_id = after if after.isdigit() else before if before.isdigit() else None
+    pivot = None
+    if pivot_id:
+        pivot = queryset.model.objects.filter(pk=pivot_id).values("pk", "created_at").first()
+
+    if pivot and pivot_id == after:
+        rows = list(
+            queryset
+            .filter(
+                Q(created_at__lt=pivot["created_at"]) |
+                Q(created_at=pivot["created_at"], pk__lt=pivot["pk"])
+            )
+            .order_by("-created_at", "-pk")[:page_size + 1]
+        )
+        has_newer, has_older = True, len(rows) > page_size
+        rows = rows[:page_size]
+    elif pivot:
+        rows = list(
+            queryset
+            .filter(
+                Q(created_at__gt=pivot["created_at"]) |
+                Q(created_at=pivot["created_at"], pk__gt=pivot["pk"])
+            )
+            .order_by("created_at", "pk")[:page_size + 1]
+        )
+        has_newer, has_older = len(rows) > page_size, True
+        rows = rows[:page_size][::-1]
+    else:
+        rows = list(queryset.order_by("-created_at", "-pk")[:page_size + 1])
+        has_newer, has_older = False, len(rows) > page_size
+        rows = rows[:page_size]
+
+    return rows, {
+        "has_newer": has_newer and bool(rows),
+        "has_older": has_older and bool(rows),
+        "newer_cursor": rows[0].pk if rows else None,
+        "older_cursor": rows[-1].pk if rows else None,
+    }
+
+
+def _status_counts(queryset):
+    # Pending/approved/rejected totals for the status tabs in one conditional aggregate
+    return queryset.aggregate(
+        pending_count=Count("pk", filter=Q(status="PENDING")),
+        approved_count=Count("pk", filter=Q(status="APPROVED")),
+        rejected_count=Count("pk", filter=Q(status="REJECTED")),
+    )
 
 
 # PUBLIC VIEWS
 
 def home(request):
-    return render(request, "hub/home.html")
+    # Anonymous visitors all see the same page, so it is rendered once and cached
+    # (signed-in users get a personalised navbar and are rendered as usual)
+    if request.user.is_authenticated or len(messages.get_messages(request)):
+        return render(request, "hub/home.html")
+
+    html = cache.get_or_set(
+        "hub:home:anonymous",
+        lambda: render_to_string("hub/home.html", request=request),
+        60 * 15,
+    )
+    response = HttpResponse(html)
+    # Let browsers reuse it too; Vary on Cookie so signing in bypasses the copy
+    patch_response_headers(response, 60 * 15)
+    patch_vary_headers(response, ("Cookie",))
+    return response
 
 
 def page_not_found(request, exception):
@@ -53,7 +144,8 @@ def register(request):
             user.last_name = form.cleaned_data.get("last_name")
             user.save()
             
-            login(request, user)
+            # Several backends are configured, so name the one that loads the profile
+            login(request, user, backend="hub.backends.ProfileModelBackend")
             messages.success(request, f"Welcome, {user.username}!")
             return redirect("hub:dashboard")
     else:
@@ -64,69 +156,113 @@ def register(request):
 
 # AUTHENTICATED VIEWS
 
+def _coordinator_dashboard_context(user):
+    # Template values for the coordinator dashboard, evaluated so they can be cached
+    dept = user.profile.department
+    now = timezone.now()
+
+    # Pending count and approved hours in one conditional aggregate
+    contribution_stats = Contribution.objects.aggregate(
+        pending=Count("pk", filter=Q(status="PENDING")),
+        total_hours=Sum("hours", filter=Q(status="APPROVED")),
+    )
+    
+    my_events = (
+        Event.objects
+        .filter(created_by=user, date__gte=now, status="SCHEDULED")
+        .select_related("department")
+        .defer("description")
+        .order_by("date")[:5]
+    )
+    
+    # The user's event total and the upcoming count in one conditional aggregate
+    upcoming_filter = Q(date__gte=now, status="SCHEDULED")
+    if dept:
+        upcoming_filter &= Q(department=dept)
+    event_stats = Event.objects.aggregate(
+        total_events=Count("pk", filter=Q(created_by=user)),
+        upcoming_count=Count("pk", filter=upcoming_filter),
+    )
+
+    return {
+        "pending_count": contribution_stats["pending"],
+        "total_hours": contribution_stats["total_hours"] or 0,
+        "my_events": list(my_events),
+        "upcoming_count": event_stats["upcoming_count"],
+        "recent_pending": list(
+            Contribution.objects
+            .filter(status="PENDING")
+            .select_related("user", "event", "department")
+            .defer("description", "rejection_reason", "event__description")
+            .order_by("-created_at")[:5]
+        ),
+        "total_events": event_stats["total_events"],
+        "department": dept,
+    }
+
+
+def _volunteer_dashboard_context(user):
+    # Template values for the volunteer dashboard, evaluated so they can be cached
+    my_hours = (
+        Contribution.objects
+        .filter(user=user, status="APPROVED")
+        .aggregate(total=Sum("hours"))["total"] or 0
+    )
+    
+    # Semi-/anti-join on the user's confirmed event ids (no JOIN + DISTINCT)
+    my_event_ids = Signup.objects.filter(user=user, status="CONFIRMED").values("event_id")
+
+    # Only the columns the dashboard cards render
+    card_fields = ("id", "title", "date", "location", "department__id", "department__name")
+
+    signed_qs = Event.objects.filter(status="SCHEDULED", pk__in=my_event_ids)
+    signed_events = (
+        signed_qs
+        .select_related("department")
+        .only(*card_fields)
+        .order_by("date")[:10]
+    )
+    
+    available_events = (
+        Event.objects
+        .filter(status="SCHEDULED")
+        .exclude(pk__in=my_event_ids)
+        .select_related("department")
+        .only(*card_fields)
+        .order_by("date")[:10]
+    )
+
+    return {
+        "my_hours": my_hours,
+        "pending": list(
+            Contribution.objects
+            .filter(user=user, status="PENDING")
+            .select_related("event", "department")
+            .defer("description", "rejection_reason", "event__description")[:5]
+        ),
+        "signed_events": list(signed_events),
+        "signed_count": signed_qs.count(),
+        "available_events": list(available_events),
+    }
+
+
 @login_required
 def dashboard(request):
     # Role-based dashboard view
     user = request.user
 
-    if user.profile.is_coordinator:
-        # Coordinator dashboard
-        dept = user.profile.department
-        pending_qs = Contribution.objects.filter(status="PENDING")
-        
-        total_hours = (
-            Contribution.objects
-            .filter(status="APPROVED")
-            .aggregate(total=Sum("hours"))["total"] or 0
-        )
-        
-        my_events = (
-            Event.objects
-            .filter(created_by=user, date__gte=timezone.now(), status="SCHEDULED")
-            .order_by("date")[:5]
-        )
-        
-        upcoming_qs = Event.objects.filter(date__gte=timezone.now(), status="SCHEDULED")
-        if dept:
-            upcoming_qs = upcoming_qs.filter(department=dept)
-
-        return render(request, "hub/coordinator_dashboard.html", {
-            "pending_count": pending_qs.count(),
-            "total_hours": total_hours,
-            "my_events": my_events,
-            "upcoming": upcoming_qs.order_by("date")[:5],
-            "recent_pending": pending_qs.select_related("user", "event", "department").order_by("-created_at")[:5],
-            "total_events": Event.objects.filter(created_by=user).count(),
-            "department": dept,
-        })
+    if request.is_coordinator:
+        role, template, build = "coordinator", "hub/coordinator_dashboard.html", _coordinator_dashboard_context
     else:
-        # Volunteer dashboard
-        my_hours = (
-            Contribution.objects
-            .filter(user=user, status="APPROVED")
-            .aggregate(total=Sum("hours"))["total"] or 0
-        )
-        
-        signed_events = (
-            Event.objects
-            .filter(signups__user=user, signups__status="CONFIRMED", status="SCHEDULED")
-            .distinct()
-            .order_by("date")
-        )
-        
-        available_events = (
-            Event.objects
-            .filter(status="SCHEDULED")
-            .exclude(signups__user=user, signups__status="CONFIRMED")
-            .order_by("date")
-        )
+        role, template, build = "volunteer", "hub/dashboard.html", _volunteer_dashboard_context
 
-        return render(request, "hub/dashboard.html", {
-            "my_hours": my_hours,
-            "pending": Contribution.objects.filter(user=user, status="PENDING")[:5],
-            "signed_events": signed_events,
-            "available_events": available_events,
-        })
+    # Any write to these models bumps its version and retires the cached
+    # context; the short timeout covers events passing their start time
+    versions = ":".join(str(count_version(model)) for model in (User, Event, Signup, Contribution))
+    context = cache.get_or_set(
+        f"hub:dashboard:{user.pk}:{role}:{versions}", lambda: build(user), 30
+    )
+    return render(request, template, context)
 
 
 @login_required
@@ -136,7 +272,11 @@ def events_list(request):
     show_mine = request.GET.get("mine") == "1"
     search_query = request.GET.get("search", "").strip()
 
-    queryset = Event.objects.prefetch_related("signups")
+    # Only the columns the event cards render
+    queryset = Event.objects.select_related("department").only(
+        "id", "title", "description", "date", "location", "capacity", "confirmed_count",
+        "department__id", "department__name",
+    )
 
     if show_mine:
         queryset = queryset.filter(created_by=request.user)
@@ -154,7 +294,7 @@ def events_list(request):
         )
 
     events = queryset.order_by("-date")
-    paginator = Paginator(events, 12)
+    paginator = PkSubqueryPaginator(events, 12)
     page_obj = paginator.get_page(request.GET.get("page", 1))
 
     return render(request, "hub/events_list.html", {
@@ -168,35 +308,40 @@ def events_list(request):
 @login_required
 def event_detail(request, pk):
     # Display detailed information about a single event
-    event = get_object_or_404(Event, pk=pk)
+    event = get_object_or_404(
+        Event.objects
+        .select_related("department", "created_by")
+        .prefetch_related(Prefetch(
+            "signups",
+            queryset=Signup.objects.filter(status="CONFIRMED").select_related("user"),
+            to_attr="confirmed_signups",
+        )),
+        pk=pk,
+    )
     
-    is_signed_up = Signup.objects.filter(
-        user=request.user, 
-        event=event, 
-        status="CONFIRMED"
-    ).exists()
+    # The prefetched roster also answers whether the current user is on it
+    is_signed_up = any(s.user_id == request.user.pk for s in event.confirmed_signups)
     
-    current_count = event.signups.filter(status="CONFIRMED").count()
-    remaining = max(0, event.capacity - current_count) if event.capacity > 0 else None
+    remaining = event.get_remaining_capacity()
     
     contributions = (
         Contribution.objects
         .filter(event=event, status="APPROVED")
-        .values("user__username")
-        .annotate(hours=Sum("hours"))
+        .values_list("user__username")
+        .annotate(hours=Sum("hours", output_field=FloatField()))
         .order_by("-hours")
     )
     
-    chart_labels = [c["user__username"] for c in contributions]
-    chart_data = [float(c["hours"]) for c in contributions]
+    # One pass over (username, hours) tuples into parallel label/data lists
+    chart_labels, chart_data = (list(col) for col in zip(*contributions)) if contributions else ([], [])
 
     return render(request, "hub/event_detail.html", {
         "event": event,
         "signed": is_signed_up,
         "remaining": remaining,
-        "participants": event.signups.filter(status="CONFIRMED").select_related("user"),
-        "hours_labels_json": json.dumps(chart_labels),
-        "hours_data_json": json.dumps(chart_data),
+        "participants": event.confirmed_signups,
+        # Serialized once in the template by json_script (DjangoJSONEncoder)
+        "hours_chart": {"labels": chart_labels, "data": chart_data},
         "has_hours_data": len(chart_labels) > 0,
     })
 
@@ -204,15 +349,25 @@ def event_detail(request, pk):
 @login_required
 def event_signup(request, pk):
     # Handle event signup for the current user
-    event = get_object_or_404(Event, pk=pk)
-
-    if event.signups.filter(user=request.user, status="CONFIRMED").exists():
-        messages.info(request, "You are already signed up.")
-    elif event.capacity and event.signups.filter(status="CONFIRMED").count() >= event.capacity:
-        messages.error(request, "This event is full.")
-    else:
-        Signup.objects.create(user=request.user, event=event, status="CONFIRMED")
-        messages.success(request, "Signed up successfully!")
+    with transaction.atomic():
+        # Lock the event row so concurrent signups can't both take the last spot
+        event = get_object_or_404(
+            Event.objects.select_for_update().only("id", "capacity", "confirmed_count"), pk=pk
+        )
+        # At most one signup per (event, user); a cancelled one is reused
+        signup = Signup.objects.filter(event=event, user=request.user).only("id", "event", "status").first()
+
+        if signup and signup.status == "CONFIRMED":
+            messages.info(request, "You are already signed up.")
+        elif event.is_full():
+            messages.error(request, "This event is full.")
+        else:
+            if signup:
+                signup.status = "CONFIRMED"
+                signup.save(update_fields=["status"])
+            else:
+                Signup.objects.create(user=request.user, event=event, status="CONFIRMED")
+            messages.success(request, "Signed up successfully!")
 
     return redirect("hub:event_detail", pk=pk)
 
@@ -223,7 +378,12 @@ def signup_list(request):
     signups = (
         Signup.objects
         .filter(user=request.user, status="CONFIRMED", event__status="SCHEDULED")
-        .select_related("event")
+        # The user is always request.user, so only the event side is joined
+        .select_related("event__department")
+        .only(
+            "id", "event__id", "event__title", "event__date", "event__location",
+            "event__status", "event__description", "event__department__name",
+        )
         .order_by("event__date")
     )
     return render(request, "hub/signup_list.html", {"signups": signups})
@@ -233,7 +393,7 @@ def signup_list(request):
 def signup_cancel(request, pk):
     # Cancel a signup for an event
     signup = get_object_or_404(
-        Signup, 
+        Signup.objects.with_related(),
         pk=pk, 
         user=request.user, 
         status="CONFIRMED"
@@ -251,101 +411,131 @@ def signup_cancel(request, pk):
 @login_required
 def contribution_create(request):
     # Handle volunteer contribution (hours) logging
-    initial_event = None
-    event_id = request.GET.get("event")
-    if event_id:
-        initial_event = Event.objects.filter(pk=event_id).first()
-
     if request.method == "POST":
         form = ContributionForm(request.POST, user=request.user)
         
         if form.is_valid():
+            # The form's event choices are already limited to scheduled events
+            # (and, for volunteers, to their confirmed signups), so validating
+            # the field is the only event lookup needed before the insert
             contribution = form.save(commit=False)
-            is_coordinator = request.user.profile.is_coordinator
-
-            if contribution.event:
-                if contribution.event.status != "SCHEDULED":
-                    form.add_error("event", "You can only log work for scheduled events.")
-                elif not is_coordinator and not Signup.objects.filter(
-                    user=request.user, 
-                    event=contribution.event, 
-                    status="CONFIRMED"
-                ).exists():
-                    form.add_error("event", "You must be signed up for this event.")
-                else:
-                    contribution.user = request.user
-                    contribution.save()
-                    messages.success(request, "Contribution submitted for approval.")
-                    return redirect("hub:dashboard")
-            else:
-                contribution.user = request.user
-                contribution.save()
-                messages.success(request, "Contribution submitted for approval.")
-                return redirect("hub:dashboard")
+            contribution.user = request.user
+            contribution.save()
+            messages.success(request, "Contribution submitted for approval.")
+            return redirect("hub:dashboard")
     else:
-        form = ContributionForm(user=request.user, initial_event=initial_event)
+        # The select only needs the pk to preselect; no event lookup here
+        event_id = request.GET.get("event", "")
+        form = ContributionForm(
+            user=request.user, initial_event=event_id if event_id.isdigit() else None
+        )
 
     return render(request, "hub/contribution_create.html", {"form": form})
 
 
-@login_required
-def reports(request):
-    # Display reports and analytics for volunteer activity
-    date_from = request.GET.get("date_from", "")
-    date_to = request.GET.get("date_to", "")
+def _report_context(date_q):
+    # Chart series and totals for the reports page (cached by reports())
+    queryset = Contribution.objects.filter(date_q, status="APPROVED")
 
-    queryset = Contribution.objects.filter(status="APPROVED")
-
-    if date_from:
-        queryset = queryset.filter(date__gte=date_from)
-    if date_to:
-        queryset = queryset.filter(date__lte=date_to)
+    # Group on the FK ids so the aggregates need no JOIN; labels come from
+    # the cached department list and one lookup for the top 10 usernames
+    dept_names = {dept.pk: dept.name for dept in Department.cached_list()}
 
     # Get top 10 volunteers
-    top_volunteers = (
+    rank_ids = list(
         queryset
-        .values("user__username")
-        .annotate(hours=Sum("hours"))
-        .order_by("-hours")[:10]
+        .values("user_id")
+        .annotate(hours=Sum("hours", output_field=FloatField()))
+        .order_by("-hours")
+        .values_list("user_id", flat=True)[:10]
     )
-    rank_labels = [t["user__username"] for t in top_volunteers]
-    
-    # Get hours by department for each top volunteer (for stacked bar chart)
-    departments = list(Department.objects.values_list("name", flat=True))
-    volunteer_dept_data = []
+    usernames = dict(User.objects.filter(pk__in=rank_ids).values_list("pk", "username"))
+    rank_labels = [usernames[user_id] for user_id in rank_ids]
     
-    for dept_name in departments:
-        dept_hours = []
-        for volunteer in rank_labels:
-            hours = queryset.filter(
-                user__username=volunteer,
-                department__name=dept_name
-            ).aggregate(total=Sum("hours"))["total"] or 0
-            dept_hours.append(float(hours))
-        volunteer_dept_data.append({
-            "label": dept_name,
-            "data": dept_hours
-        })
-    
-    dept_totals = (
+    # Get hours by department for each top volunteer (for stacked bar chart),
+    # one GROUP BY over (department, volunteer) instead of a query per pair
+    pair_hours = {}
+    if rank_ids:
+        pair_hours = {
+            (dept_id, user_id): hours
+            for dept_id, user_id, hours in (
+                queryset
+                .filter(user_id__in=rank_ids)
+                .values_list("department_id", "user_id")
+                .annotate(hours=Sum("hours", output_field=FloatField()))
+            )
+        }
+    dept_totals = list(
         queryset
-        .values("department__name")
-        .annotate(hours=Sum("hours"))
+        .values_list("department_id")
+        .annotate(hours=Sum("hours", output_field=FloatField()))
         .order_by("-hours")
     )
 
-    rank_data = [float(t["hours"]) for t in top_volunteers]
+    # The cached list can lag behind a department created in another worker;
+    # name any ids it doesn't know with one direct lookup
+    missing_ids = {dept_id for dept_id, _ in dept_totals} - dept_names.keys()
+    if missing_ids:
+        dept_names.update(Department.objects.filter(pk__in=missing_ids).values_list("pk", "name"))
+        dept_names = dict(sorted(dept_names.items(), key=lambda item: item[1]))
 
-    return render(request, "hub/reports.html", {
-        "rank_labels_json": json.dumps(rank_labels),
-        "rank_datasets_json": json.dumps(volunteer_dept_data),
-        "dept_labels_json": json.dumps([d["department__name"] for d in dept_totals]),
-        "dept_data_json": json.dumps([float(d["hours"]) for d in dept_totals]),
+    volunteer_dept_data = [
+        {
+            "label": dept_name,
+            "data": [pair_hours.get((dept_id, user_id), 0.0) for user_id in rank_ids],
+        }
+        for dept_id, dept_name in dept_names.items()
+    ]
+    
+    dept_labels = [dept_names[dept_id] for dept_id, _ in dept_totals]
+    dept_data = [hours for _, hours in dept_totals]
+
+    # Every approved contribution has a department, so the per-department
+    # totals already add up to all approved hours in range
+    total_hours = round(sum(dept_data), 2)
+
+    totals = Contribution.objects.aggregate(
+        pending_total=Count("pk", filter=Q(status="PENDING")),
+        total_contributions=Count("pk"),
+    )
+
+    return {
+        # Both charts go out as one payload, serialized once by json_script
+        "charts": {
+            "rank": {"labels": rank_labels, "datasets": volunteer_dept_data},
+            "dept": {"labels": dept_labels, "data": dept_data},
+        },
         "has_rank_data": bool(rank_labels) and bool(volunteer_dept_data),
-        "has_dept_data": dept_totals.exists(),
-        "total_hours": sum(rank_data),
-        "pending_total": Contribution.objects.filter(status="PENDING").count(),
-        "total_contributions": Contribution.objects.count(),
+        "has_dept_data": bool(dept_totals),
+        "total_hours": total_hours,
+        "pending_total": totals["pending_total"],
+        "total_contributions": totals["total_contributions"],
+    }
+
+
+@login_required
+def reports(request):
+    # Display reports and analytics for volunteer activity
+    date_from = request.GET.get("date_from", "")
+    date_to = request.GET.get("date_to", "")
+
+    date_q = Q()
+    if date_from:
+        date_q &= Q(date__gte=date_from)
+    if date_to:
+        date_q &= Q(date__lte=date_to)
+
+    # Keyed on the contribution version, so any contribution change orphans
+    # every cached range; the timeout bounds staleness from renames
+    key_source = f"{Contribution.reports_version()}:{date_from}:{date_to}"
+    context = cache.get_or_set(
+        "hub:reports:" + md5(key_source.encode()).hexdigest(),
+        lambda: _report_context(date_q),
+        300,
+    )
+
+    return render(request, "hub/reports.html", {
+        **context,
         "date_from": date_from,
         "date_to": date_to,
     })
@@ -392,8 +582,12 @@ def event_edit(request, pk):
 @login_required
 @coordinator_required
 def event_delete(request, pk):
-    # Delete an event
-    event = get_object_or_404(Event, pk=pk, created_by=request.user)
+    # Delete an event (signup total annotated for the confirmation page)
+    event = get_object_or_404(
+        Event.objects.annotate(signup_total=Count("signups")),
+        pk=pk,
+        created_by=request.user,
+    )
 
     if request.method == "POST":
         event_title = event.title
@@ -407,15 +601,17 @@ def event_delete(request, pk):
 @login_required
 @coordinator_required
 def event_update_status(request, pk):
-    # Update event status
-    event = get_object_or_404(Event, pk=pk)
-
-    if request.method == "POST":
-        new_status = request.POST.get("status")
-        if new_status in dict(Event.STATUS_CHOICES):
-            event.status = new_status
-            event.save()
-            messages.success(request, "Event status updated.")
+    # Update event status with a single UPDATE (its row count doubles as the 404 check)
+    new_status = request.POST.get("status")
+
+    if request.method == "POST" and new_status in EVENT_STATUSES:
+        if not Event.objects.filter(pk=pk).update(status=new_status):
+            raise Http404("No Event matches the given query.")
+        # update() skips signals; the status filter feeds cached list counts
+        bump_count_version(Event)
+        messages.success(request, "Event status updated.")
+    else:
+        get_object_or_404(Event.objects.only("pk"), pk=pk)
 
     return redirect("hub:event_detail", pk=pk)
 
@@ -446,28 +642,25 @@ def approvals_list(request):
     if selected_department:
         queryset = queryset.filter(department=selected_department)
 
-    def count_by_status(status):
-        base = Contribution.objects.filter(status=status)
-        if selected_department:
-            base = base.filter(department=selected_department)
-        return base.count()
+    count_base = Contribution.objects.all()
+    if selected_department:
+        count_base = count_base.filter(department=selected_department)
 
-    contributions = (
+    contributions, page = _seek_page(
+        request,
         queryset
         .select_related("user", "event", "department", "approved_by")
-        .order_by("-created_at")
+        .only(*CONTRIBUTION_LIST_FIELDS),
+        12,
     )
-    paginator = Paginator(contributions, 12)
-    page_obj = paginator.get_page(request.GET.get("page", 1))
 
     return render(request, "hub/approvals_list.html", {
-        "contributions": page_obj,
+        "contributions": contributions,
+        "page": page,
         "status_filter": status_filter,
         "dept_filter_value": dept_filter_value,
-        "pending_count": count_by_status("PENDING"),
-        "approved_count": count_by_status("APPROVED"),
-        "rejected_count": count_by_status("REJECTED"),
-        "departments": Department.objects.all(),
+        **_status_counts(count_base),
+        "departments": Department.cached_list(),
         "my_department": my_department,
         "selected_department": selected_department,
     })
@@ -477,7 +670,10 @@ def approvals_list(request):
 @coordinator_required
 def approval_detail(request, pk):
     # Display detailed view of a contribution for review
-    contribution = get_object_or_404(Contribution, pk=pk)
+    contribution = get_object_or_404(
+        Contribution.objects.select_related("user", "event", "department", "approved_by"),
+        pk=pk,
+    )
     return render(request, "hub/approval_detail.html", {"contrib": contribution})
 
 
@@ -485,13 +681,15 @@ def approval_detail(request, pk):
 @coordinator_required
 def approval_approve(request, pk):
     # Approve a pending contribution
-    contribution = get_object_or_404(Contribution, pk=pk, status="PENDING")
-    
-    contribution.status = "APPROVED"
-    contribution.approved_by = request.user
-    contribution.approved_at = timezone.now()
-    contribution.save()
-    
+    # One conditional UPDATE; a zero row count means missing or no longer pending
+    updated = Contribution.objects.filter(pk=pk, status="PENDING").update(
+        status="APPROVED", approved_by=request.user, approved_at=timezone.now()
+    )
+    if not updated:
+        raise Http404
+    # update() skips signals, so drop cached reports and list counts here
+    Contribution.invalidate_reports()
+    bump_count_version(Contribution)
     messages.success(request, "Contribution approved.")
     return redirect("hub:approvals_list")
 
@@ -500,20 +698,27 @@ def approval_approve(request, pk):
 @coordinator_required
 def approval_reject(request, pk):
     # Reject a pending contribution with reason
-    contribution = get_object_or_404(Contribution, pk=pk, status="PENDING")
-
     if request.method == "POST":
         rejection_reason = request.POST.get("rejection_reason", "").strip()
-        
-        contribution.status = "REJECTED"
-        contribution.approved_by = request.user
-        contribution.approved_at = timezone.now()
-        contribution.rejection_reason = rejection_reason
-        contribution.save()
-        
+        updated = Contribution.objects.filter(pk=pk, status="PENDING").update(
+            status="REJECTED",
+            approved_by=request.user,
+            approved_at=timezone.now(),
+            rejection_reason=rejection_reason,
+        )
+        if not updated:
+            raise Http404
+        # update() skips signals, so drop cached reports and list counts here
+        Contribution.invalidate_reports()
+        bump_count_version(Contribution)
         messages.warning(request, "Contribution rejected.")
         return redirect("hub:approvals_list")
 
+    contribution = get_object_or_404(
+        Contribution.objects.select_related("user", "department"),
+        pk=pk,
+        status="PENDING",
+    )
     return render(request, "hub/approval_reject.html", {"contrib": contribution})
 
 
@@ -531,18 +736,15 @@ def all_logs(request):
     if dept_filter.isdigit():
         queryset = queryset.filter(department_id=int(dept_filter))
 
-    contributions = queryset.order_by("-created_at")
-    paginator = Paginator(contributions, 25)
-    page_obj = paginator.get_page(request.GET.get("page", 1))
+    contributions, page = _seek_page(request, queryset.only(*CONTRIBUTION_LIST_FIELDS), 25)
 
     return render(request, "hub/all_logs.html", {
-        "contributions": page_obj,
+        "contributions": contributions,
+        "page": page,
         "status_filter": status_filter,
         "dept_filter": dept_filter,
-        "pending_count": Contribution.objects.filter(status="PENDING").count(),
-        "approved_count": Contribution.objects.filter(status="APPROVED").count(),
-        "rejected_count": Contribution.objects.filter(status="REJECTED").count(),
-        "departments": Department.objects.all(),
+        **_status_counts(Contribution.objects.all()),
+        "departments": Department.cached_list(),
     })
 
 
@@ -550,23 +752,33 @@ def all_logs(request):
 @coordinator_required
 def log_update_status(request, pk):
     # Update contribution status
-    contribution = get_object_or_404(Contribution, pk=pk)
-
     if request.method == "POST":
         new_status = request.POST.get("status")
         
-        if new_status in dict(Contribution.STATUS_CHOICES):
-            old_status = contribution.status
-            contribution.status = new_status
-
-            if new_status in ("APPROVED", "REJECTED") and old_status == "PENDING":
-                contribution.approved_by = request.user
-                contribution.approved_at = timezone.now()
+        if new_status in CONTRIBUTION_STATUSES:
+            changes = {"status": new_status}
+
+            if new_status in ("APPROVED", "REJECTED"):
+                # Stamp the reviewer only when leaving PENDING; the CASE reads
+                # the row's old status inside the same UPDATE
+                was_pending = Q(status="PENDING")
+                changes["approved_by"] = Case(
+                    When(was_pending, then=Value(request.user.pk)),
+                    default=F("approved_by"),
+                    output_field=IntegerField(),
+                )
+                changes["approved_at"] = Case(
+                    When(was_pending, then=Value(timezone.now())), default=F("approved_at")
+                )
             elif new_status == "PENDING":
-                contribution.approved_by = None
-                contribution.approved_at = None
-
-            contribution.save()
+                changes["approved_by"] = None
+                changes["approved_at"] = None
+
+            if not Contribution.objects.filter(pk=pk).update(**changes):
+                raise Http404
+            # update() skips signals, so drop cached reports and list counts here
+            Contribution.invalidate_reports()
+            bump_count_version(Contribution)
             messages.success(request, f"Log status updated to {new_status}.")
 
     return redirect("hub:all_logs")
@@ -575,37 +787,43 @@ def log_update_status(request, pk):
 @login_required
 @coordinator_required
 def export_logs_csv(request):
-    # Export all contribution logs to CSV file
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="voluntrack_logs.csv"'
+    # Export all contribution logs to CSV file, streamed row by row
+    writer = csv.writer(_Echo())
 
-    writer = csv.writer(response)
-    
-    writer.writerow([
-        "User", "Event", "Department", "Date", "Hours",
-        "Status", "Approved By", "Approved At", "Rejection Reason", "Description"
-    ])
+    status_labels = dict(Contribution.STATUS_CHOICES)
 
+    # Plain tuples straight from the cursor; no model instances per row
     contributions = (
         Contribution.objects
-        .select_related("user", "event", "department", "approved_by")
+        .values_list(
+            "user__username", "event__title", "department__name", "date", "hours",
+            "status", "approved_by__username", "approved_at", "rejection_reason", "description",
+        )
         .order_by("-created_at")
+        .iterator(chunk_size=2000)
     )
-    
-    for c in contributions:
-        writer.writerow([
-            c.user.username,
-            c.event.title if c.event else "",
-            c.department.name,
-            c.date,
-            c.hours,
-            c.get_status_display(),
-            c.approved_by.username if c.approved_by else "",
-            c.approved_at or "",
-            c.rejection_reason or "",
-            c.description[:100] if c.description else "",
-        ])
 
+    def rows():
+        yield writer.writerow([
+            "User", "Event", "Department", "Date", "Hours",
+            "Status", "Approved By", "Approved At", "Rejection Reason", "Description"
+        ])
+        for username, event, dept, date, hours, status, approver, approved_at, reason, desc in contributions:
+            yield writer.writerow([
+                username,
+                event or "",
+                dept,
+                date,
+                hours,
+                status_labels.get(status, status),
+                approver or "",
+                approved_at or "",
+                reason or "",
+                desc[:100] if desc else "",
+            ])
+
+    response = StreamingHttpResponse(rows(), content_type="text/csv")
+    response["Content-Disposition"] = 'attachment; filename="voluntrack_logs.csv"'
     return response
 
 
@@ -613,7 +831,16 @@ def export_logs_csv(request):
 @coordinator_required
 def coordinator_management(request):
     # Manage coordinator users (promote/demote)
-    users = User.objects.select_related('profile').order_by('username')
+    users = (
+        User.objects
+        .select_related('profile', 'profile__department')
+        # Skip password hashes and login metadata the table never shows
+        .only(
+            'id', 'username', 'first_name', 'last_name', 'email',
+            'profile__id', 'profile__is_coordinator', 'profile__department__name',
+        )
+        .order_by('username')
+    )
     
     dept_filter = request.GET.get('department', '')
     search_query = request.GET.get('search', '').strip()
@@ -634,29 +861,39 @@ def coordinator_management(request):
         action = request.POST.get('action')
 
         if user_id and action in ['promote', 'demote']:
-            target_user = get_object_or_404(User, pk=user_id)
-
-            if action == 'demote' and target_user == request.user:
+            # Parse once so every later check compares the same integer pk
+            try:
+                user_id = int(user_id)
+            except ValueError:
+                raise Http404
+            username = User.objects.filter(pk=user_id).values_list('username', flat=True).first()
+            if username is None:
+                raise Http404
+
+            if action == 'demote' and request.user.pk == user_id:
                 messages.error(request, "You cannot remove your own coordinator status.")
             else:
-                target_user.profile.is_coordinator = (action == 'promote')
-
-                if action == 'promote' and request.user.profile.department:
-                    target_user.profile.department = request.user.profile.department
-
-                target_user.profile.save()
-                
-                action_text = "promoted to" if action == "promote" else "removed from"
-                messages.success(request, f"{target_user.username} {action_text} coordinator.")
+                # Single UPDATE on the profile row; the target is never loaded
+                changes = {'is_coordinator': action == 'promote'}
+                my_department_id = request.user.profile.department_id
+                if action == 'promote' and my_department_id:
+                    changes['department_id'] = my_department_id
+                if Profile.objects.filter(user_id=user_id).update(**changes):
+                    bump_count_version(User)
+
+                    action_text = "promoted to" if action == "promote" else "removed from"
+                    messages.success(request, f"{username} {action_text} coordinator.")
+                else:
+                    messages.error(request, f"{username} has no profile to update.")
 
             return redirect('hub:coordinator_management')
 
-    paginator = Paginator(users, 25)
+    paginator = PkSubqueryPaginator(users, 25)
     page_obj = paginator.get_page(request.GET.get("page", 1))
 
     return render(request, "hub/coordinator_management.html", {
         "users": page_obj,
-        "departments": Department.objects.all(),
+        "departments": Department.cached_list(),
         "dept_filter": dept_filter,
         "search": search_query,
     })
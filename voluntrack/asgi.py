@@ -9,7 +9,12 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 import os
 
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'voluntrack.settings')
 
 application = get_asgi_application()
+
+# Reading reverse_dict warms the URL resolver at import time, so the patterns
+# compile at worker boot rather than on each worker's first request
+_ = get_resolver().reverse_dict
@@ -19,6 +19,10 @@ DEBUG = os.environ.get("DJANGO_DEBUG", "False").lower() == "true"
 
 ALLOWED_HOSTS = ["localhost", "127.0.0.1"] if not DEBUG else ["*"]
 
+# Set DJANGO_ENABLE_ADMIN=False on public-only workers to leave the admin
+# URL tree out of the resolver entirely
+ENABLE_ADMIN = os.environ.get("DJANGO_ENABLE_ADMIN", "True").lower() == "true"
+
 
 # Application definition
 
@@ -39,6 +43,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'hub.middleware.ProfileMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -74,6 +79,18 @@ DATABASES = {
 }
 
 
+# Cache
+# Shared by every worker process on the host, so the version keys bumped on
+# writes (page counts, reports, department list) invalidate for all of them
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get("DJANGO_CACHE_DIR", BASE_DIR / '.django_cache'),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -125,6 +142,13 @@ STATICFILES_DIRS = [
     BASE_DIR / 'hub' / 'static',
 ]
 
+# Loads request.user with its profile joined (see hub/backends.py); ModelBackend
+# stays listed so sessions created before the switch still resolve their user
+AUTHENTICATION_BACKENDS = [
+    'hub.backends.ProfileModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
 # Authentication redirects
 LOGIN_REDIRECT_URL = 'hub:dashboard'
 LOGOUT_REDIRECT_URL = 'hub:home'
@@ -1,15 +1,25 @@
 """Root URL Configuration."""
 
+from django.conf import settings
 from django.contrib import admin
+from django.contrib.auth import views as auth_views
 from django.urls import include, path
 
+from hub import views as hub_views
+
 urlpatterns = [
-    path("admin/", admin.site.urls),
-    path("accounts/", include("django.contrib.auth.urls")),
+    # Only the auth views the site links to (no password change/reset flows)
+    path("accounts/", include([
+        path("login/", auth_views.LoginView.as_view(), name="login"),
+        path("logout/", auth_views.LogoutView.as_view(), name="logout"),
+    ])),
     path("", include(("hub.urls", "hub"), namespace="hub")),
 ]
 
-# Custom error handlers
-handler404 = "hub.views.page_not_found"
-handler500 = "hub.views.server_error"
-handler403 = "hub.views.permission_denied"
+if settings.ENABLE_ADMIN:
+    urlpatterns.insert(0, path("admin/", admin.site.urls))
+
+# Custom error handlers (callables, so Django skips the import_string lookup)
+handler404 = hub_views.page_not_found
+handler500 = hub_views.server_error
+handler403 = hub_views.permission_denied
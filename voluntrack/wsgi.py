@@ -13,7 +13,12 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'voluntrack.settings')
 
 application = get_wsgi_application()
+
+# Reading reverse_dict warms the URL resolver at import time, so the patterns
+# compile at worker boot rather than on each worker's first request
+_ = get_resolver().reverse_dict